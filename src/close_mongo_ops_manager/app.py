@@ -16,6 +16,7 @@ from textual.reactive import reactive
 from textual.widgets import DataTable, Footer, Header
 from textual.coordinate import Coordinate
 from textual.containers import VerticalScroll
+from textual.timer import Timer
 
 from pymongo.uri_parser import parse_uri
 
@@ -28,7 +29,7 @@ from close_mongo_ops_manager.messages import (
     OperationsLoaded,
     SelectionChanged,
 )
-from close_mongo_ops_manager.mongodb_manager import MongoDBManager
+from close_mongo_ops_manager.mongodb_manager import MAX_OPERATIONS, MongoDBManager
 from close_mongo_ops_manager.operations_view import OperationsView
 from close_mongo_ops_manager.statusbar import StatusBar
 from close_mongo_ops_manager.theme_manager import ThemeManager
@@ -42,6 +43,12 @@ MIN_REFRESH_INTERVAL = 1
 MAX_REFRESH_INTERVAL = 10
 DEFAULT_REFRESH_INTERVAL = 2
 STEP_REFRESH_INTERVAL = 1  # Interval change step
+FILTER_DEBOUNCE_SECONDS = 0.25  # Delay before a filter change triggers a refresh
+MAX_IDLE_MULTIPLIER = 8  # Max auto-refresh backoff when the op list is unchanged
+
+# Formatted "Effective Users" cells keyed by the user-name tuple; the same
+# handful of users repeat across ops and refreshes, so the join is done once.
+_EFFECTIVE_USERS_CACHE: dict[tuple[str, ...], str] = {}
 
 
 # Set up logging
@@ -130,7 +137,11 @@ class MongoOpsManager(App):
         self.connection_string = connection_string
         self.refresh_interval = refresh_interval
         self.mongodb: MongoDBManager | None = None
-        self._refresh_task: asyncio.Task | None = None
+        self._refresh_timer: Timer | None = None
+        self._filter_debounce_timer: Timer | None = None
+        self._truncation_notified = False
+        self._idle_multiplier = 1
+        self._last_opid_snapshot: frozenset[str] = frozenset()
         self.log_file = LOG_FILE
         self._status_bar: StatusBar | None = None
         self.namespace: str = namespace
@@ -256,7 +267,7 @@ class MongoOpsManager(App):
                 self._status_bar.set_connection_status(True, host_info)
 
             self.refresh_operations()
-            self._refresh_task = asyncio.create_task(self.auto_refreshing())
+            self._restart_refresh_timer()
 
             # Ensure operations view has focus after setup
             self.operations_view.focus()
@@ -272,6 +283,7 @@ class MongoOpsManager(App):
         new_interval = MongoOpsManager.validate_refresh_interval(new_interval)
         if new_interval != self.refresh_interval:
             self.refresh_interval = new_interval
+            self._restart_refresh_timer()
             if self._status_bar:
                 self._status_bar.set_refresh_interval(self.refresh_interval)
 
@@ -281,24 +293,27 @@ class MongoOpsManager(App):
         new_interval = MongoOpsManager.validate_refresh_interval(new_interval)
         if new_interval != self.refresh_interval:
             self.refresh_interval = new_interval
+            self._restart_refresh_timer()
             if self._status_bar:
                 self._status_bar.set_refresh_interval(self.refresh_interval)
 
-    async def auto_refreshing(self) -> None:
-        """Background task for auto-refreshing functionality."""
-        while True:
-            try:
-                if self.auto_refresh and self.mongodb:
-                    self.refresh_operations()
-                await asyncio.sleep(self.refresh_interval)
-            except asyncio.CancelledError:
-                # Re-raise CancelledError to allow proper task cancellation
-                logger.info("Auto-refresh task cancelled")
-                raise
-            except Exception as e:
-                logger.error(f"Auto-refresh error: {e}", exc_info=True)
-                # Continue running but wait before retry
-                await asyncio.sleep(self.refresh_interval)
+    def _restart_refresh_timer(self) -> None:
+        """(Re)create the auto-refresh timer with the current interval.
+
+        Timers fire exactly once per interval, so a paused auto-refresh
+        costs nothing — there is no polling loop waking up to check state.
+        """
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        # Back off while the op list is stable (see _update_operations_view),
+        # capped so the table never goes more than MAX_REFRESH_INTERVAL
+        # seconds stale.
+        interval = min(
+            self.refresh_interval * self._idle_multiplier, MAX_REFRESH_INTERVAL
+        )
+        self._refresh_timer = self.set_interval(interval, self.refresh_operations)
+        if not self.auto_refresh:
+            self._refresh_timer.pause()
 
     async def _update_operations_view(
         self,
@@ -317,11 +332,10 @@ class MongoOpsManager(App):
             # Store the operations data in the view (after sorting)
             self.operations_view.current_ops = ops_data
 
-            # Clear all rows to ensure correct ordering
-            self.operations_view.clear()
-
-            # Update existing rows and add new ones in sorted order
-            for i, op in enumerate(ops_data):
+            # Build the new row tuples first so they can be diffed against
+            # what is currently displayed.
+            new_rows: list[tuple[str, tuple]] = []
+            for op in ops_data:
                 # Skip operations without opid
                 if not op or "opid" not in op:
                     logger.warning("Skipping operation without opid")
@@ -340,13 +354,15 @@ class MongoOpsManager(App):
                 if mongos_host:
                     client_info = f"{client_info} ({mongos_host.split('.', 1)[0]})"
 
-                # Get effective users
-                effective_users = op.get("effectiveUsers", [])
-                users_str = (
-                    ", ".join(u.get("user", "") for u in effective_users if u)
-                    if effective_users
-                    else "N/A"
-                )
+                # Get effective users (memoized; the same users repeat)
+                effective_users = op.get("effectiveUsers") or ()
+                users_key = tuple(u.get("user", "") for u in effective_users if u)
+                users_str = _EFFECTIVE_USERS_CACHE.get(users_key)
+                if users_str is None:
+                    users_str = ", ".join(users_key) if users_key else "N/A"
+                    if len(_EFFECTIVE_USERS_CACHE) > 1024:
+                        _EFFECTIVE_USERS_CACHE.clear()
+                    _EFFECTIVE_USERS_CACHE[users_key] = users_str
 
                 # Check if we need to show selection
                 is_selected = op_id in selected_ops_before_refresh
@@ -363,12 +379,56 @@ class MongoOpsManager(App):
                     users_str,
                 )
 
-                # Add row
-                self.operations_view.add_row(*row_data, key=op_id)
+                new_rows.append((op_id, row_data))
+
+            previous_rows = self.operations_view.row_snapshot
+            if [op_id for op_id, _ in previous_rows] == [
+                op_id for op_id, _ in new_rows
+            ]:
+                # Same operations in the same order (the common case between
+                # auto-refresh ticks): update only the cells that changed
+                # instead of tearing down and rebuilding every row.
+                for row_index, ((_, old_row), (_, new_row)) in enumerate(
+                    zip(previous_rows, new_rows)
+                ):
+                    if old_row == new_row:
+                        continue
+                    for column_index, (old_cell, new_cell) in enumerate(
+                        zip(old_row, new_row)
+                    ):
+                        if old_cell != new_cell:
+                            # Re-measure the column when the cell grew, or a
+                            # widening value (e.g. a mongos suffix appearing)
+                            # would render cropped until the next full rebuild.
+                            self.operations_view.update_cell_at(
+                                Coordinate(row_index, column_index),
+                                new_cell,
+                                update_width=len(str(new_cell)) > len(str(old_cell)),
+                            )
+            else:
+                # Clear all rows to ensure correct ordering
+                self.operations_view.clear()
+                for op_id, row_data in new_rows:
+                    self.operations_view.add_row(*row_data, key=op_id)
+
+            self.operations_view.row_snapshot = new_rows
 
             # Build set of current operation IDs
             current_op_ids = {str(op["opid"]) for op in ops_data if op and "opid" in op}
 
+            # Adaptive polling: double the refresh interval while
+            # consecutive refreshes return the same operations, and snap
+            # back to the configured interval on any change.
+            opid_snapshot = frozenset(current_op_ids)
+            if opid_snapshot == self._last_opid_snapshot:
+                new_multiplier = min(self._idle_multiplier * 2, MAX_IDLE_MULTIPLIER)
+            else:
+                new_multiplier = 1
+            self._last_opid_snapshot = opid_snapshot
+            if new_multiplier != self._idle_multiplier:
+                self._idle_multiplier = new_multiplier
+                self._restart_refresh_timer()
+
             # Restore selected operations
             self.operations_view.selected_ops = {
                 op_id
@@ -462,15 +522,24 @@ class MongoOpsManager(App):
             # Start loading timer
             loading_timer = asyncio.create_task(set_loading_after_delay())
 
-            # Fetch operations
-            ops = await self.mongodb.get_operations(self.operations_view.filters)
+            # Fetch operations, sorted by running time on the server
+            ops = await self.mongodb.get_operations(
+                self.operations_view.filters,
+                sort_running_time_asc=self.operations_view.sort_running_time_asc,
+            )
 
-            # Sort operations by running time if needed
-            if hasattr(self.operations_view, "sort_running_time_asc"):
-                ops.sort(
-                    key=lambda x: float(x.get("secs_running", 0)),
-                    reverse=not self.operations_view.sort_running_time_asc,
-                )
+            # Warn (once per episode) when the server-side limit truncated
+            # the result set, so the user knows the table is incomplete.
+            if len(ops) >= MAX_OPERATIONS:
+                if not self._truncation_notified:
+                    self._truncation_notified = True
+                    self.notify(
+                        f"Showing first {MAX_OPERATIONS} operations — "
+                        "refine filters to see the rest",
+                        severity="warning",
+                    )
+            else:
+                self._truncation_notified = False
 
             # Call the new method to update the UI
             scheduled_ok = self.call_later(
@@ -507,6 +576,11 @@ class MongoOpsManager(App):
     def action_toggle_refresh(self) -> None:
         """Toggle auto-refresh."""
         self.auto_refresh = not self.auto_refresh
+        if self._refresh_timer is not None:
+            if self.auto_refresh:
+                self._refresh_timer.resume()
+            else:
+                self._refresh_timer.pause()
         if self._status_bar:
             self._status_bar.set_refresh_status(self.auto_refresh)
 
@@ -540,18 +614,14 @@ class MongoOpsManager(App):
         if not self.operations_view.selected_ops:
             return
 
-        # Clear the selected operations set
-        self.operations_view.selected_ops.clear()
+        # Clear the selection set and checkbox cells in place; a full
+        # MongoDB refresh just to redraw the selection column is wasteful.
+        self.operations_view.clear_selections()
 
         # Update StatusBar with selected count (zero)
         if self._status_bar:
             self._status_bar.set_selected_count(0)
 
-        # Emit message about selection change
-        self.operations_view.post_message(SelectionChanged(count=0))
-
-        self.refresh_operations()
-
     def action_toggle_selection(self) -> None:
         """Toggle between selecting all operations and deselecting all operations."""
         # If there are any selected operations, deselect them
@@ -660,25 +730,35 @@ class MongoOpsManager(App):
                     if op_id is not None and op_host:
                         op_hosts[str(op_id)] = op_host
 
-                for opid in list(self.operations_view.selected_ops):
-                    try:
-                        if await self.mongodb.kill_operation(
-                            opid, host=op_hosts.get(opid)
-                        ):
-                            success_count += 1
-                        else:
-                            error_count += 1
-                            logger.error(
-                                f"Failed to kill operation {opid}: Operation not found"
-                            )
-                    except Exception as e:
+                # Fan the kills out concurrently; each kill spends most of
+                # its time waiting on killOp round-trips and verification
+                # polls, so the total wall clock is the slowest kill rather
+                # than the sum of all of them.
+                opids = list(self.operations_view.selected_ops)
+                results = await asyncio.gather(
+                    *(
+                        self.mongodb.kill_operation(opid, host=op_hosts.get(opid))
+                        for opid in opids
+                    ),
+                    return_exceptions=True,
+                )
+                for opid, result in zip(opids, results):
+                    if isinstance(result, BaseException):
                         error_count += 1
                         self.notify(
-                            f"Failed to kill operation {opid}: {str(e)}",
+                            f"Failed to kill operation {opid}: {result}",
                             severity="error",
                         )
                         logger.error(
-                            f"Failed to kill operation {opid}: {e}", exc_info=True
+                            f"Failed to kill operation {opid}: {result}",
+                            exc_info=result,
+                        )
+                    elif result:
+                        success_count += 1
+                    else:
+                        error_count += 1
+                        logger.error(
+                            f"Failed to kill operation {opid}: Operation not found"
                         )
 
                 # Clear selections after all operations are processed
@@ -713,7 +793,13 @@ class MongoOpsManager(App):
     async def on_filter_changed(self, event: FilterChanged) -> None:
         """Handle filter changes."""
         self.operations_view.filters = event.filters
-        self.refresh_operations()
+        # Debounce so a burst of keystrokes triggers one refresh instead of
+        # one MongoDB aggregation per character typed.
+        if self._filter_debounce_timer is not None:
+            self._filter_debounce_timer.stop()
+        self._filter_debounce_timer = self.set_timer(
+            FILTER_DEBOUNCE_SECONDS, self.refresh_operations
+        )
 
     def action_sort_by_time(self) -> None:
         """Sort operations by running time."""
@@ -737,19 +823,9 @@ class MongoOpsManager(App):
 
     async def on_unmount(self) -> None:
         """Clean up resources when the application exits."""
-        # Cancel the refresh task if it's running
-        if (
-            hasattr(self, "_refresh_task")
-            and self._refresh_task
-            and not self._refresh_task.done()
-        ):
-            self._refresh_task.cancel()
-            try:
-                await self._refresh_task
-            except asyncio.CancelledError:
-                logger.info("Refresh task cancelled successfully")
-            except Exception as e:
-                logger.error(f"Error cancelling refresh task: {e}")
+        # Stop the auto-refresh timer if it's running
+        if getattr(self, "_refresh_timer", None) is not None:
+            self._refresh_timer.stop()
 
         # Close MongoDB connections
         if hasattr(self, "mongodb") and self.mongodb:
@@ -759,7 +835,7 @@ class MongoOpsManager(App):
                 logger.error(f"Error closing MongoDB connections: {e}")
 
 
-def main() -> None:
+def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description=f"Close MongoDB Operations Manager v{version('close-mongo-ops-manager')}"
     )
@@ -821,7 +897,7 @@ def main() -> None:
         help="Show the version of the application",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     logger.info(
         f"Starting Close MongoDB Operations Manager v{version('close-mongo-ops-manager')}"
@@ -19,6 +19,17 @@ class FilterBar(Horizontal):
         ("ctrl+f", "toggle_filter_bar", "Toggle Filters"),
     ]
 
+    # Maps each filter input id to the filter key it produces, so the key
+    # doesn't have to be re-derived from the widget id on every keystroke.
+    FILTER_INPUT_KEYS = {
+        "filter-opid": "opid",
+        "filter-operation": "operation",
+        "filter-running-time": "running_time",
+        "filter-client": "client",
+        "filter-description": "description",
+        "filter-effective-users": "effective_users",
+    }
+
     DEFAULT_CSS = """
     FilterBar {
         height: auto;
@@ -68,18 +79,18 @@ class FilterBar(Horizontal):
     def on_button_pressed(self, event: Button.Pressed) -> None:
         if event.button.id == "clear-filters":
             # Find the first input
-            first_input = None
-            inputs = self.query(".filter-input")
-            if inputs:
-                first_input = inputs.first()
-
-            # Clear all inputs
-            for input in inputs:
-                if isinstance(input, Input):
+            inputs = [widget for _, widget in self._filter_inputs]
+            first_input = inputs[0] if inputs else None
+
+            # Nothing to clear: skip the message (and the refresh it would
+            # trigger) and just restore focus
+            if any(input.value for input in inputs):
+                # Clear all inputs
+                for input in inputs:
                     input.value = ""
 
-            # Send filter change message
-            self.post_message(FilterChanged({}))
+                # Send filter change message
+                self.post_message(FilterChanged({}))
 
             # Focus the first input after clearing
             if first_input:
@@ -90,11 +101,9 @@ class FilterBar(Horizontal):
         current_input = event.input
 
         # Collect all non-empty filters
-        filters = {}
-        for input in self.query(".filter-input"):
-            if isinstance(input, Input) and input.value:
-                filter_key = input.id.replace("filter-", "").replace("-", "_")  # type: ignore
-                filters[filter_key] = input.value
+        filters = {
+            key: widget.value for key, widget in self._filter_inputs if widget.value
+        }
 
         # Send the filter changed message with current filters
         self.post_message(FilterChanged(filters))
@@ -122,3 +131,8 @@ class FilterBar(Horizontal):
         """Setup event handling when the widget is mounted."""
         # Capture key events from children (including inputs)
         self.capture_keys = True
+        # Resolve the filter inputs once; queried per keystroke otherwise
+        self._filter_inputs: list[tuple[str, Input]] = [
+            (key, self.query_one(f"#{input_id}", Input))
+            for input_id, key in self.FILTER_INPUT_KEYS.items()
+        ]
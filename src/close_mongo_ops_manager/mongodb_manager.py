@@ -14,10 +14,67 @@ import logging
 
 logger = logging.getLogger("mongo_ops_manager")
 
+# Maximum number of operations returned per refresh. Keeps the result set
+# (and the UI table) bounded on stressed servers; the app warns when the
+# limit is hit.
+MAX_OPERATIONS = 1000
+
 
 class MongoDBManager:
     """Handles MongoDB connection and operations."""
 
+    # Base $currentOp arguments. These never change between refreshes so
+    # they are built once here instead of per get_operations call.
+    CURRENT_OP_ARGS = {
+        "allUsers": True,
+        "idleConnections": False,
+        "idleCursors": False,
+        "idleSessions": True,
+        "localOps": False,
+        "backtrace": False,
+    }
+
+    # Static match condition excluding system namespaces, no-op operations
+    # and internal users. Only read, never mutated.
+    SYSTEM_OPS_FILTER = {
+        "$nor": [
+            {"ns": {"$regex": "^admin\\.", "$options": "i"}},
+            {"ns": {"$regex": "^config\\.", "$options": "i"}},
+            {"ns": {"$regex": "^local\\.", "$options": "i"}},
+            {"op": "none"},  # Filter out no-op operations
+            {"effectiveUsers.user": "__system"},  # exclude system users
+        ]
+    }
+
+    # Project only the fields we need to reduce data transfer.
+    OPERATIONS_PROJECTION = {
+        "$project": {
+            "opid": 1,
+            "host": 1,
+            "type": 1,
+            "op": 1,
+            "secs_running": 1,
+            "client": 1,
+            "client_s": 1,
+            "clientMetadata.mongos.host": 1,
+            "desc": 1,
+            "effectiveUsers": 1,
+            "active": 1,
+            "ns": 1,
+            "command": 1,
+            "planSummary": 1,
+            "currentOpTime": 1,
+            "microsecs_running": 1,
+            "killPending": 1,
+            "WiredTigerTxn": 1,
+            "lsid": 1,
+            "transaction": 1,
+            "locks": 1,
+            "waitingForLock": 1,
+            "lockStats": 1,
+        }
+    }
+
     # Connection options that conflict with a direct, single-host connection.
     DIRECT_CLIENT_EXCLUDED_OPTIONS = frozenset(
         {
@@ -42,6 +99,14 @@ class MongoDBManager:
         self.is_mongos: bool = False
         self._connection_string: str = ""
         self._host_clients: dict[str, AsyncMongoClient] = {}
+        self._host_client_locks: dict[str, asyncio.Lock] = {}
+        self._pipeline_cache: tuple[tuple, list[dict]] | None = None
+
+    async def __aenter__(self) -> "MongoDBManager":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
 
     async def close(self) -> None:
         """Close all MongoDB connections properly."""
@@ -95,165 +160,142 @@ class MongoDBManager:
             # Verify connection
             await self.admin_db.command("ping")
 
-            server_status = await self.admin_db.command("serverStatus")
-            version = server_status.get("version", "unknown version")
-            process = server_status.get("process", "unknown process")
-            self.is_mongos = process == "mongos"
+            # hello and buildInfo return a handful of fields; serverStatus
+            # (used here previously) can run to megabytes on large
+            # deployments and only fed this log line.
+            hello = await self.admin_db.command("hello")
+            build_info = await self.admin_db.command("buildInfo")
+            version = build_info.get("version", "unknown version")
+            self.is_mongos = hello.get("msg") == "isdbgrid"
+            process = "mongos" if self.is_mongos else "mongod"
             logger.info(f"Connected to MongoDB {version} ({process})")
 
             return self
         except PyMongoError as e:
             raise MongoConnectionError(f"Failed to connect to MongoDB: {e}")
 
-    async def get_operations(self, filters: dict[str, str] | None = None) -> list[dict]:
-        """Get current operations with appropriate handling"""
-        if self.admin_db is None:
-            logger.error("Admin database not initialized")
-            return []
-
-        try:
-            # Base currentOp arguments
-            current_op_args = {
-                "allUsers": True,
-                "idleConnections": False,
-                "idleCursors": False,
-                "idleSessions": True,
-                "localOps": False,
-                "backtrace": False,
+    def _build_operations_pipeline(
+        self,
+        filters: dict[str, str] | None,
+        sort_running_time_asc: bool | None,
+    ) -> list[dict]:
+        """Assemble (or reuse) the aggregation pipeline for get_operations.
+
+        The pipeline only depends on the namespace, the system-ops setting,
+        the sort direction and the filter values, all of which are stable
+        between refresh ticks, so the last built pipeline is cached and
+        reused until one of them changes.
+        """
+        cache_key = (
+            self.namespace,
+            self.hide_system_ops,
+            sort_running_time_asc,
+            tuple(sorted(filters.items())) if filters else (),
+        )
+        if self._pipeline_cache is not None and self._pipeline_cache[0] == cache_key:
+            return self._pipeline_cache[1]
+
+        # When system/no-op operations are hidden anyway, don't ask the
+        # server to serialize idle sessions at all — they would only be
+        # discarded by the $match below after being shipped over the wire.
+        current_op_args = self.CURRENT_OP_ARGS
+        if self.hide_system_ops:
+            current_op_args = {**current_op_args, "idleSessions": False}
+
+        pipeline: list[dict] = [{"$currentOp": current_op_args}]
+
+        # Build a flat $match document instead of wrapping every
+        # condition in an $and — each condition targets a distinct key,
+        # and a flat match is smaller on the wire and easier for the
+        # query planner to optimize. Conditions are still added
+        # cheapest-first so non-matching operations are rejected before
+        # the expensive predicates (the $or over two client fields and
+        # the $expr that stringifies opid).
+        match_stage: dict[str, Any] = {}
+
+        # Add system operations filter, regardless of namespace/filter settings.
+        if self.hide_system_ops:
+            match_stage.update(self.SYSTEM_OPS_FILTER)
+
+        if self.namespace:
+            match_stage["ns"] = {
+                "$regex": f"^{re.escape(self.namespace)}",
+                "$options": "i",
             }
 
-            pipeline = [{"$currentOp": current_op_args}]
-
-            match_stage: dict[str, Any] = {"$and": []}
-
-            # Add system operations filter, regardless of namespace/filter settings.
-            if self.hide_system_ops:
-                match_stage["$and"].append(
-                    {
-                        "$nor": [
-                            {"ns": {"$regex": "^admin\\.", "$options": "i"}},
-                            {"ns": {"$regex": "^config\\.", "$options": "i"}},
-                            {"ns": {"$regex": "^local\\.", "$options": "i"}},
-                            {"op": "none"},  # Filter out no-op operations
-                            {"effectiveUsers.user": "__system"},  # exclude system users
-                        ]
-                    }
-                )
-
-            if self.namespace:
-                match_stage["$and"].append(
-                    {"ns": {"$regex": f"^{re.escape(self.namespace)}", "$options": "i"}}
-                )
-
-            if filters:
-                if filters.get("opid"):
-                    escaped_opid = re.escape(filters["opid"])
-                    match_stage["$and"].append(
-                        {
-                            "$expr": {
-                                "$regexMatch": {
-                                    "input": {"$toString": "$opid"},
-                                    "regex": escaped_opid,
-                                    "options": "i",
-                                }
-                            }
-                        }
-                    )
-                if filters.get("operation"):
-                    match_stage["$and"].append(
-                        {
-                            "op": {
-                                "$regex": re.escape(filters["operation"]),
-                                "$options": "i",
-                            }
-                        }
-                    )
-                if filters.get("client"):
-                    escaped_client = re.escape(filters["client"])
-                    match_stage["$and"].append(
-                        {
-                            "$or": [
-                                {
-                                    "client": {
-                                        "$regex": escaped_client,
-                                        "$options": "i",
-                                    }
-                                },
-                                {
-                                    "client_s": {
-                                        "$regex": escaped_client,
-                                        "$options": "i",
-                                    }
-                                },
-                            ]
-                        }
-                    )
-                if filters.get("description"):
-                    match_stage["$and"].append(
-                        {
-                            "desc": {
-                                "$regex": re.escape(filters["description"]),
-                                "$options": "i",
-                            }
-                        }
-                    )
-                if filters.get("effective_users"):
-                    match_stage["$and"].append(
-                        {
-                            "effectiveUsers": {
-                                "$elemMatch": {
-                                    "user": {
-                                        "$regex": re.escape(filters["effective_users"]),
-                                        "$options": "i",
-                                    }
-                                }
-                            }
+        if filters:
+            if filters.get("running_time") and filters["running_time"].isdigit():
+                match_stage["secs_running"] = {"$gte": int(filters["running_time"])}
+            if filters.get("operation"):
+                match_stage["op"] = {
+                    "$regex": re.escape(filters["operation"]),
+                    "$options": "i",
+                }
+            if filters.get("description"):
+                match_stage["desc"] = {
+                    "$regex": re.escape(filters["description"]),
+                    "$options": "i",
+                }
+            if filters.get("effective_users"):
+                match_stage["effectiveUsers"] = {
+                    "$elemMatch": {
+                        "user": {
+                            "$regex": re.escape(filters["effective_users"]),
+                            "$options": "i",
                         }
-                    )
-                if filters.get("running_time") and filters["running_time"].isdigit():
-                    match_stage["$and"].append(
-                        {"secs_running": {"$gte": int(filters["running_time"])}}
-                    )
+                    }
+                }
+            if filters.get("client"):
+                escaped_client = re.escape(filters["client"])
+                match_stage["$or"] = [
+                    {"client": {"$regex": escaped_client, "$options": "i"}},
+                    {"client_s": {"$regex": escaped_client, "$options": "i"}},
+                ]
+            if filters.get("opid"):
+                match_stage["$expr"] = {
+                    "$regexMatch": {
+                        "input": {"$toString": "$opid"},
+                        "regex": re.escape(filters["opid"]),
+                        "options": "i",
+                    }
+                }
 
-            if match_stage["$and"]:
-                pipeline.append({"$match": match_stage})
+        if match_stage:
+            pipeline.append({"$match": match_stage})
 
-            # Project only the fields we need to reduce data transfer
+        # Sort server-side so the $limit below keeps the most relevant
+        # operations rather than an arbitrary subset.
+        if sort_running_time_asc is not None:
             pipeline.append(
-                {
-                    "$project": {
-                        "opid": 1,
-                        "host": 1,
-                        "type": 1,
-                        "op": 1,
-                        "secs_running": 1,
-                        "client": 1,
-                        "client_s": 1,
-                        "clientMetadata.mongos.host": 1,
-                        "desc": 1,
-                        "effectiveUsers": 1,
-                        "active": 1,
-                        "ns": 1,
-                        "command": 1,
-                        "planSummary": 1,
-                        "currentOpTime": 1,
-                        "microsecs_running": 1,
-                        "killPending": 1,
-                        "WiredTigerTxn": 1,
-                        "lsid": 1,
-                        "transaction": 1,
-                        "locks": 1,
-                        "waitingForLock": 1,
-                        "lockStats": 1,
-                    }
-                }
+                {"$sort": {"secs_running": 1 if sort_running_time_asc else -1}}
             )
 
-            # Limit results to prevent overwhelming the UI
-            pipeline.append({"$limit": 1000})
+        pipeline.append(self.OPERATIONS_PROJECTION)
+
+        # Limit results to prevent overwhelming the UI
+        pipeline.append({"$limit": MAX_OPERATIONS})
+
+        self._pipeline_cache = (cache_key, pipeline)
+        return pipeline
+
+    async def get_operations(
+        self,
+        filters: dict[str, str] | None = None,
+        sort_running_time_asc: bool | None = None,
+    ) -> list[dict]:
+        """Get current operations with appropriate handling"""
+        if self.admin_db is None:
+            logger.error("Admin database not initialized")
+            return []
+
+        try:
+            pipeline = self._build_operations_pipeline(filters, sort_running_time_asc)
 
             cursor = await self.admin_db.aggregate(pipeline)
-            inprog = await cursor.to_list(None)
+            # The pipeline's $limit already bounds the result server-side;
+            # the explicit length here keeps the client allocation bounded
+            # even if the pipeline shape changes.
+            inprog = await cursor.to_list(MAX_OPERATIONS)
 
             return inprog
         except PyMongoError as e:
@@ -293,29 +335,39 @@ class MongoDBManager:
         if cached is not None:
             return cached
 
-        try:
-            parsed = parse_uri(self._connection_string)
-            options = {
-                key: value
-                for key, value in parsed.get("options", {}).items()
-                if key.lower() not in self.DIRECT_CLIENT_EXCLUDED_OPTIONS
-            }
-            host_client: AsyncMongoClient = AsyncMongoClient(
-                f"mongodb://{host}",
-                directConnection=True,
-                username=parsed.get("username"),
-                password=parsed.get("password"),
-                serverSelectionTimeoutMS=5000,
-                connectTimeoutMS=5000,
-                **options,
-            )
-            await host_client.admin.command("ping")
-        except Exception as e:
-            logger.warning(f"Could not connect directly to {host}: {e}")
-            return None
+        # Concurrent kills pinned to the same host (the gather fan-out in
+        # the app) must not each build a client: only the last one cached
+        # would ever be closed, leaking the rest. A per-host lock serializes
+        # creation; later arrivals hit the re-check and reuse the winner.
+        lock = self._host_client_locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            cached = self._host_clients.get(host)
+            if cached is not None:
+                return cached
+
+            try:
+                parsed = parse_uri(self._connection_string)
+                options = {
+                    key: value
+                    for key, value in parsed.get("options", {}).items()
+                    if key.lower() not in self.DIRECT_CLIENT_EXCLUDED_OPTIONS
+                }
+                host_client: AsyncMongoClient = AsyncMongoClient(
+                    f"mongodb://{host}",
+                    directConnection=True,
+                    username=parsed.get("username"),
+                    password=parsed.get("password"),
+                    serverSelectionTimeoutMS=5000,
+                    connectTimeoutMS=5000,
+                    **options,
+                )
+                await host_client.admin.command("ping")
+            except Exception as e:
+                logger.warning(f"Could not connect directly to {host}: {e}")
+                return None
 
-        self._host_clients[host] = host_client
-        return host_client
+            self._host_clients[host] = host_client
+            return host_client
 
     async def _operation_exists(
         self, opid: str, admin_db: AsyncDatabase | None = None
@@ -388,16 +440,30 @@ class MongoDBManager:
                         f"{normalized_opid} reported by {host}"
                     )
 
-            # Convert string opid to numeric if possible (for non-sharded operations)
+            # Split the sharded "shard:opid" form exactly once; the numeric
+            # tail is kept as a fallback for servers that reject the
+            # composite form with TypeMismatch.
             use_opid: str | int = normalized_opid
-            if ":" not in normalized_opid and normalized_opid.isdigit():
+            numeric_fallback: int | None = None
+            _shard_id, _, numeric_part = normalized_opid.partition(":")
+            if numeric_part:
+                try:
+                    numeric_fallback = int(numeric_part)
+                except ValueError:
+                    numeric_fallback = None
+                else:
+                    if numeric_fallback <= 0:
+                        numeric_fallback = None
+            else:
+                # Convert string opid to numeric if possible (for non-sharded
+                # operations); negative or non-numeric opids stay strings
                 try:
                     numeric_opid = int(normalized_opid)
-                    if numeric_opid > 0:  # Ensure it's a valid positive number
+                except ValueError:
+                    pass
+                else:
+                    if numeric_opid > 0:
                         use_opid = numeric_opid
-                except (ValueError, OverflowError) as e:
-                    logger.warning(f"Failed to convert opid to numeric: {e}")
-                    use_opid = normalized_opid
 
             # Try killing the operation with retries
             for attempt in range(max_retries):
@@ -407,9 +473,10 @@ class MongoDBManager:
 
                     if result.get("ok") == 1:
                         # Start verification process with timeout
-                        verification_start = time.monotonic()
+                        deadline = time.monotonic() + verify_timeout
+                        poll_interval = 0.1
 
-                        while time.monotonic() - verification_start < verify_timeout:
+                        while time.monotonic() < deadline:
                             # Check on the same server the kill was sent to
                             operation_exists = await self._operation_exists(
                                 normalized_opid, admin_db
@@ -421,8 +488,13 @@ class MongoDBManager:
                                 )
                                 return True
 
-                            # Brief pause before next verification check
-                            await asyncio.sleep(1.0)
+                            # Back off exponentially between checks, never
+                            # sleeping past the verification deadline
+                            remaining = deadline - time.monotonic()
+                            if remaining <= 0:
+                                break
+                            await asyncio.sleep(min(poll_interval, remaining))
+                            poll_interval = min(poll_interval * 2, 1.0)
 
                         # If we reach here, operation still exists after timeout
                         logger.warning(
@@ -434,27 +506,20 @@ class MongoDBManager:
                             continue
 
                 except PyMongoError as e:
-                    # Special handling for sharded cluster operations
-                    if "TypeMismatch" in str(e) and ":" in normalized_opid:
-                        try:
-                            # For sharded operations, try to extract and kill the numeric part
-                            _shard_id, numeric_part = normalized_opid.split(
-                                ":", maxsplit=1
-                            )
-                            if numeric_part.isdigit():
-                                logger.info(
-                                    f"Retrying kill with numeric part of sharded operation: {numeric_part}"
-                                )
-                                return await self.kill_operation(
-                                    numeric_part,
-                                    max_retries=max_retries - attempt,
-                                    verify_timeout=verify_timeout,
-                                    host=host,
-                                )
-                        except Exception as inner_e:
-                            logger.error(
-                                f"Error processing sharded operation ID: {inner_e}"
-                            )
+                    # Special handling for sharded cluster operations: switch
+                    # to the numeric tail computed at entry and retry within
+                    # this loop rather than recursing into a fresh
+                    # retry/verify cycle.
+                    if (
+                        "TypeMismatch" in str(e)
+                        and numeric_fallback is not None
+                        and use_opid != numeric_fallback
+                    ):
+                        logger.info(
+                            f"Retrying kill with numeric part of sharded operation: {numeric_fallback}"
+                        )
+                        use_opid = numeric_fallback
+                        continue
 
                     # Log the error and continue retrying if attempts remain
                     logger.error(
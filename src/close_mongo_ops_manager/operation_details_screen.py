@@ -5,6 +5,40 @@ from textual.screen import ModalScreen
 from textual.widgets import TextArea
 
 
+def format_operation_details(operation: dict) -> str:
+    """Format an operation document as the details screen text."""
+    details = []
+    details.append(f"Operation ID: {operation.get('opid', 'N/A')}")
+    details.append(f"Type: {operation.get('op', 'N/A')}")
+    details.append(f"Namespace: {operation.get('ns', 'N/A')}")
+    details.append(f"Running Time: {operation.get('secs_running', 0)}s")
+    # Get client info with fallbacks
+    client_info = operation.get("client_s") or operation.get("client") or "N/A"
+
+    # Add mongos host info if available
+    mongos_host = operation.get("clientMetadata", {}).get("mongos", {}).get("host", "")
+    if mongos_host:
+        # Extract first part of hostname for brevity
+        short_host = mongos_host.split(".", 1)[0]
+        client_info = f"{client_info} ({short_host})"
+
+    details.append(f"Client: {client_info}")
+
+    # Format command details
+    command = operation.get("command", {})
+    if command:
+        details.append("\nCommand Details:")
+        for key, value in command.items():
+            details.append(f"  {key}: {value}")
+
+    # Format plan summary if available
+    plan_summary = operation.get("planSummary", "")
+    if plan_summary:
+        details.append(f"\nPlan Summary: {plan_summary}")
+
+    return "\n".join(details)
+
+
 class OperationDetailsScreen(ModalScreen):
     """Screen for viewing detailed operation information."""
 
@@ -47,9 +81,16 @@ class OperationDetailsScreen(ModalScreen):
         Binding("end", "scroll_end", "End", show=False),
     ]
 
-    def __init__(self, operation: dict) -> None:
+    def __init__(self, operation: dict, details_text: str | None = None) -> None:
         super().__init__()
         self.operation = operation
+        # Callers that already hold the rendered text (e.g. a cache hit in
+        # OperationsView) can pass it in to skip the formatting loop.
+        self.details_text = (
+            details_text
+            if details_text is not None
+            else format_operation_details(operation)
+        )
 
     def action_scroll_up(self) -> None:
         """Scroll up in the details container."""
@@ -84,47 +125,6 @@ class OperationDetailsScreen(ModalScreen):
     def compose(self) -> ComposeResult:
         with ScrollableContainer(id="details-container"):
             with VerticalScroll(id="details-content"):
-                # Format operation details
-                details = []
-                details.append(f"Operation ID: {self.operation.get('opid', 'N/A')}")
-                details.append(f"Type: {self.operation.get('op', 'N/A')}")
-                details.append(f"Namespace: {self.operation.get('ns', 'N/A')}")
-                details.append(
-                    f"Running Time: {self.operation.get('secs_running', 0)}s"
-                )
-                # Get client info with fallbacks
-                client_info = (
-                    self.operation.get("client_s")
-                    or self.operation.get("client")
-                    or "N/A"
-                )
-
-                # Add mongos host info if available
-                mongos_host = (
-                    self.operation.get("clientMetadata", {})
-                    .get("mongos", {})
-                    .get("host", "")
-                )
-                if mongos_host:
-                    # Extract first part of hostname for brevity
-                    short_host = mongos_host.split(".", 1)[0]
-                    client_info = f"{client_info} ({short_host})"
-
-                details.append(f"Client: {client_info}")
-
-                # Format command details
-                command = self.operation.get("command", {})
-                if command:
-                    details.append("\nCommand Details:")
-                    for key, value in command.items():
-                        details.append(f"  {key}: {value}")
-
-                # Format plan summary if available
-                plan_summary = self.operation.get("planSummary", "")
-                if plan_summary:
-                    details.append(f"\nPlan Summary: {plan_summary}")
-
-                # Join all details with newlines
                 yield TextArea(
-                    "\n".join(details), classes="details-text", read_only=True
+                    self.details_text, classes="details-text", read_only=True
                 )
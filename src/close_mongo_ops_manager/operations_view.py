@@ -3,7 +3,10 @@ from textual.widgets import DataTable
 from textual.coordinate import Coordinate
 
 from close_mongo_ops_manager.messages import SelectionChanged
-from close_mongo_ops_manager.operation_details_screen import OperationDetailsScreen
+from close_mongo_ops_manager.operation_details_screen import (
+    OperationDetailsScreen,
+    format_operation_details,
+)
 
 
 class OperationsView(DataTable):
@@ -36,6 +39,12 @@ class OperationsView(DataTable):
         self.selected_ops: set[str] = set()
         self.can_focus = True
         self.current_ops: list[dict] = []
+        # (opid, row tuple) pairs currently displayed, used to diff refreshes
+        # in place instead of rebuilding the whole table.
+        self.row_snapshot: list[tuple[str, tuple]] = []
+        # Rendered details text per opid, invalidated when the operation's
+        # running time changes, so reopening the same op skips formatting.
+        self._detail_cache: dict[str, tuple[int, str]] = {}
 
     @property
     def loading(self) -> bool:
@@ -85,4 +94,14 @@ class OperationsView(DataTable):
 
     def show_operation_details(self, op: dict) -> None:
         """Show detailed view of the operation."""
-        self.app.push_screen(OperationDetailsScreen(op))
+        opid = str(op.get("opid", ""))
+        secs_running = op.get("secs_running", 0)
+        cached = self._detail_cache.get(opid)
+        if cached is not None and cached[0] == secs_running:
+            details_text = cached[1]
+        else:
+            details_text = format_operation_details(op)
+            if len(self._detail_cache) > 256:
+                self._detail_cache.clear()
+            self._detail_cache[opid] = (secs_running, details_text)
+        self.app.push_screen(OperationDetailsScreen(op, details_text=details_text))
@@ -1,92 +1,124 @@
 """Shared test fixtures for close-mongo-ops-manager test suite."""
 
+import asyncio
+import time
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
 
 
-@pytest.fixture
-def sample_mongodb_operation():
-    """Return a realistic MongoDB operation with all common fields."""
-    return {
-        "type": "op",
-        "host": "mongodb-server:27017",
-        "desc": "conn12345",
-        "connectionId": 12345,
-        "client": "192.168.1.100:54321",
-        "clientMetadata": {
-            "driver": {"name": "PyMongo", "version": "4.6.3"},
-            "os": {
-                "type": "Linux",
-                "name": "Linux",
-                "architecture": "x86_64",
-                "version": "6.8.0-1031-aws",
-            },
-            "platform": "CPython 3.12.3.final.0",
-        },
-        "active": True,
-        "currentOpTime": "2025-11-03T10:00:00.000+00:00",
-        "effectiveUsers": [{"user": "testuser", "db": "testdb"}],
-        "runBy": [{"user": "admin", "db": "admin"}],
-        "threaded": True,
-        "opid": 123456,
-        "secs_running": 5,
-        "microsecs_running": 5000000,
-        "op": "query",
-        "ns": "testdb.collection",
-        "redacted": False,
-        "command": {
-            "find": "collection",
-            "filter": {"field": "value"},
-            "sort": {"_id": 1},
-            "limit": 100,
-        },
-        "numYields": 10,
-        "locks": {"Global": "r", "Database": "r", "Collection": "r"},
-        "waitingForLock": False,
-        "waitingForFlowControl": False,
-    }
+@pytest.fixture(scope="session")
+def wait_for():
+    """Return a poller that waits for a condition instead of a fixed sleep.
 
+    Fixed pilot.pause(...) delays either waste wall time or flake when the
+    event being waited on is slower than the guess; polling the observable
+    state returns as soon as it is true.
+    """
 
-@pytest.fixture
-def sample_mongodb_operation_with_mongos():
-    """Return a MongoDB operation with mongos metadata (sharded cluster)."""
-    return {
-        "type": "op",
-        "host": "shard-server-01:27017",
-        "desc": "conn67890",
-        "connectionId": 67890,
-        "client": "10.0.1.50:45678",
-        "clientMetadata": {
-            "driver": {"name": "PyMongo", "version": "4.6.3"},
-            "os": {"type": "Linux", "name": "Linux"},
-            "platform": "CPython 3.12.3.final.0",
-            "mongos": {
-                "host": "mongos-router:27020",
-                "client": "10.0.2.100:41978",
-                "version": "7.0.18-11",
-            },
-        },
-        "opid": 789012,
-        "secs_running": 15,
-        "op": "update",
-        "ns": "testdb.users",
-        "active": True,
-        "effectiveUsers": [{"user": "appuser", "db": "testdb"}],
-        "command": {
-            "update": "users",
-            "updates": [{"q": {"_id": 123}, "u": {"$set": {"status": "active"}}}],
-        },
-    }
+    async def _wait_for(condition, timeout: float = 2.0) -> None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError(f"Condition not met within {timeout}s: {condition}")
 
+    return _wait_for
 
-@pytest.fixture
-def sample_mongodb_operations_list(
-    sample_mongodb_operation, sample_mongodb_operation_with_mongos
-):
-    """Return a list of varied MongoDB operations for testing."""
-    return [
-        sample_mongodb_operation,
-        sample_mongodb_operation_with_mongos,
+
+@pytest.fixture(scope="session")
+def assert_notified(wait_for):
+    """Wait until the app has notified with every given substring.
+
+    Joining the notification messages once per poll replaces the repeated
+    any(... in msg for msg in notifications) scans at the call sites, and
+    polling means no fixed sleep is needed for notifications to arrive.
+    """
+
+    async def _assert_notified(app, *substrings: str, timeout: float = 2.0) -> None:
+        def _all_present() -> bool:
+            blob = "\n".join(n.message for n in app._notifications)
+            return all(substring in blob for substring in substrings)
+
+        await wait_for(_all_present, timeout=timeout)
+
+    return _assert_notified
+
+
+# Sample operations are built once and shared read-only across the session;
+# tests only read them, so per-test reconstruction is wasted work.
+_SAMPLE_OP = {
+    "type": "op",
+    "host": "mongodb-server:27017",
+    "desc": "conn12345",
+    "connectionId": 12345,
+    "client": "192.168.1.100:54321",
+    "clientMetadata": {
+        "driver": {"name": "PyMongo", "version": "4.6.3"},
+        "os": {
+            "type": "Linux",
+            "name": "Linux",
+            "architecture": "x86_64",
+            "version": "6.8.0-1031-aws",
+        },
+        "platform": "CPython 3.12.3.final.0",
+    },
+    "active": True,
+    "currentOpTime": "2025-11-03T10:00:00.000+00:00",
+    "effectiveUsers": [{"user": "testuser", "db": "testdb"}],
+    "runBy": [{"user": "admin", "db": "admin"}],
+    "threaded": True,
+    "opid": 123456,
+    "secs_running": 5,
+    "microsecs_running": 5000000,
+    "op": "query",
+    "ns": "testdb.collection",
+    "redacted": False,
+    "command": {
+        "find": "collection",
+        "filter": {"field": "value"},
+        "sort": {"_id": 1},
+        "limit": 100,
+    },
+    "numYields": 10,
+    "locks": {"Global": "r", "Database": "r", "Collection": "r"},
+    "waitingForLock": False,
+    "waitingForFlowControl": False,
+}
+
+_SAMPLE_OP_WITH_MONGOS = {
+    "type": "op",
+    "host": "shard-server-01:27017",
+    "desc": "conn67890",
+    "connectionId": 67890,
+    "client": "10.0.1.50:45678",
+    "clientMetadata": {
+        "driver": {"name": "PyMongo", "version": "4.6.3"},
+        "os": {"type": "Linux", "name": "Linux"},
+        "platform": "CPython 3.12.3.final.0",
+        "mongos": {
+            "host": "mongos-router:27020",
+            "client": "10.0.2.100:41978",
+            "version": "7.0.18-11",
+        },
+    },
+    "opid": 789012,
+    "secs_running": 15,
+    "op": "update",
+    "ns": "testdb.users",
+    "active": True,
+    "effectiveUsers": [{"user": "appuser", "db": "testdb"}],
+    "command": {
+        "update": "users",
+        "updates": [{"q": {"_id": 123}, "u": {"$set": {"status": "active"}}}],
+    },
+}
+
+_SAMPLE_OPS_LIST = (
+    MappingProxyType(_SAMPLE_OP),
+    MappingProxyType(_SAMPLE_OP_WITH_MONGOS),
+    MappingProxyType(
         {
             "opid": 111111,
             "type": "op",
@@ -98,7 +130,9 @@ def sample_mongodb_operations_list(
             "active": True,
             "effectiveUsers": [{"user": "logger", "db": "testdb"}],
             "command": {"insert": "logs", "documents": [{"msg": "test"}]},
-        },
+        }
+    ),
+    MappingProxyType(
         {
             "opid": 222222,
             "type": "op",
@@ -110,11 +144,30 @@ def sample_mongodb_operations_list(
             "active": True,
             "effectiveUsers": [{"user": "cleaner", "db": "testdb"}],
             "command": {"delete": "temp", "deletes": [{"q": {"old": True}}]},
-        },
-    ]
+        }
+    ),
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_mongodb_operation():
+    """Return a realistic MongoDB operation with all common fields."""
+    return MappingProxyType(_SAMPLE_OP)
+
+
+@pytest.fixture(scope="session")
+def sample_mongodb_operation_with_mongos():
+    """Return a MongoDB operation with mongos metadata (sharded cluster)."""
+    return MappingProxyType(_SAMPLE_OP_WITH_MONGOS)
+
+
+@pytest.fixture(scope="session")
+def sample_mongodb_operations_list():
+    """Return a list of varied MongoDB operations for testing."""
+    return _SAMPLE_OPS_LIST
+
+
+@pytest.fixture(scope="session")
 def sample_filter_values():
     """Return common filter test values."""
     return {
@@ -137,6 +190,16 @@ def sample_filter_values():
     }
 
 
+# Canned responses for the strict client's command dispatch; module-level so
+# every fixture invocation reuses the same dicts.
+_COMMAND_RESPONSES = {
+    "ping": {"ok": 1},
+    "hello": {"ok": 1, "isWritablePrimary": True},
+    "buildInfo": {"ok": 1, "version": "7.0.0"},
+    "killOp": {"ok": 1},
+}
+
+
 @pytest.fixture
 def mock_async_mongo_client_strict():
     """
@@ -147,31 +210,31 @@ def mock_async_mongo_client_strict():
     - admin.aggregate() is called with valid pipelines
     - Results have expected structure
     """
-    client = MagicMock()
-
-    # Mock admin database
-    admin_db = MagicMock()
-    client.admin = admin_db
 
     # Mock command responses
     async def mock_command(cmd, **kwargs):
-        if cmd == "ping":
-            return {"ok": 1}
-        elif cmd == "serverStatus":
-            return {"ok": 1, "version": "7.0.0", "process": "mongod"}
-        elif cmd == "killOp":
-            return {"ok": 1}
-        else:
-            raise ValueError(f"Unexpected command: {cmd}")
+        try:
+            return _COMMAND_RESPONSES[cmd]
+        except KeyError:
+            raise ValueError(f"Unexpected command: {cmd}") from None
+
+    # Plain coroutine functions instead of AsyncMock: nothing asserts call
+    # counts on these, and AsyncMock adds per-call bookkeeping overhead.
+    async def mock_to_list(*args, **kwargs):
+        return []
 
-    admin_db.command = AsyncMock(side_effect=mock_command)
+    async def mock_close():
+        return None
 
     # Mock aggregate with cursor
-    mock_cursor = MagicMock()
-    mock_cursor.to_list = AsyncMock(return_value=[])
-    admin_db.aggregate = AsyncMock(return_value=mock_cursor)
+    mock_cursor = SimpleNamespace(to_list=mock_to_list)
 
-    # Mock close
-    client.close = AsyncMock()
+    async def mock_aggregate(*args, **kwargs):
+        return mock_cursor
 
-    return client
+    # The client and admin database are only attribute containers here, so
+    # SimpleNamespace beats MagicMock's child-mock factory machinery.
+    return SimpleNamespace(
+        admin=SimpleNamespace(command=mock_command, aggregate=mock_aggregate),
+        close=mock_close,
+    )
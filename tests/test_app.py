@@ -4,18 +4,39 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from pymongo.errors import PyMongoError
 
 from close_mongo_ops_manager.app import MongoOpsManager, main
-from close_mongo_ops_manager.mongodb_manager import MongoDBManager
+
+
+def _initial_refresh_done(app: MongoOpsManager) -> bool:
+    """True once on_mount connected and the first refresh has completed.
+
+    Tests must not seed selections before this point: a refresh that loads
+    zero operations drops selections for rows that are no longer displayed.
+    """
+    return (
+        app.mongodb is not None
+        and app.mongodb.get_operations.called
+        and not app.operations_view.loading
+    )
+
+
+class _StubMongoDBManager:
+    """Minimal MongoDBManager stand-in for the app tests.
+
+    MagicMock(spec=MongoDBManager) introspects the whole class on every
+    fixture build; the app only touches these four methods.
+    """
+
+    def __init__(self) -> None:
+        self.connect = AsyncMock(return_value=self)
+        self.get_operations = AsyncMock(return_value=[])
+        self.kill_operation = AsyncMock(return_value=True)
+        self.close = AsyncMock()
 
 
 @pytest.fixture
 def mock_mongo_manager():
     """Fixture for a mocked MongoDBManager."""
-    manager = MagicMock(spec=MongoDBManager)
-    manager.connect = AsyncMock(return_value=manager)
-    manager.get_operations = AsyncMock(return_value=[])
-    manager.kill_operation = AsyncMock(return_value=True)
-    manager.close = AsyncMock()
-    return manager
+    return _StubMongoDBManager()
 
 
 @pytest.fixture
@@ -35,16 +56,16 @@ async def test_app_initialization(app: MongoOpsManager):
     assert app.connection_string == "mongodb://localhost:27017"
 
 
-async def test_app_mount_and_connection(app: MongoOpsManager):
+async def test_app_mount_and_connection(app: MongoOpsManager, wait_for):
     """Test app mounting and MongoDB connection."""
-    async with app.run_test() as pilot:
-        await pilot.pause(0.1)  # Allow on_mount to complete
-        assert app.mongodb is not None
+    async with app.run_test():
+        # Wait for on_mount to complete
+        await wait_for(lambda: _initial_refresh_done(app))
         app.mongodb.connect.assert_called_once()
         assert app.operations_view.loading is False
 
 
-async def test_app_connection_failure(mock_mongo_manager):
+async def test_app_connection_failure(mock_mongo_manager, assert_notified):
     """Test app behavior on MongoDB connection failure."""
     mock_mongo_manager.connect.side_effect = PyMongoError("Connection failed")
     with (
@@ -52,19 +73,15 @@ async def test_app_connection_failure(mock_mongo_manager):
         patch("close_mongo_ops_manager.app.setup_logging"),
     ):
         app = MongoOpsManager(connection_string="mongodb://localhost:27017")
-        async with app.run_test() as pilot:
-            await pilot.pause(0.1)
-            # Check for the specific error message
-            assert any(
-                "Failed to connect: Connection failed" in n.message
-                for n in pilot.app._notifications
-            )
+        async with app.run_test():
+            # Wait for the specific error message
+            await assert_notified(app, "Failed to connect: Connection failed")
 
 
-async def test_refresh_action(app: MongoOpsManager):
+async def test_refresh_action(app: MongoOpsManager, wait_for):
     """Test the refresh action."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)  # Allow connection to establish
+        await wait_for(lambda: _initial_refresh_done(app))
         app.mongodb.get_operations.reset_mock()
         await pilot.press("ctrl+r")
         app.mongodb.get_operations.assert_called_once()
@@ -89,48 +106,83 @@ async def test_kill_selected_action_no_selection(
         assert "No operations selected" in [n.message for n in pilot.app._notifications]
 
 
-async def test_kill_selected_action_with_selection(
+@pytest.mark.parametrize(
+    ("opids", "kill_behavior", "expected_notifications"),
+    [
+        pytest.param(
+            ["12345"],
+            {"return_value": True},
+            ["Successfully killed 1 operation(s)"],
+            id="success",
+        ),
+        pytest.param(
+            ["111", "222"],
+            {"side_effect": [True, False]},
+            [
+                "Successfully killed 1 operation(s)",
+                "Failed to kill 1 operation(s)",
+            ],
+            id="partial_failure",
+        ),
+        pytest.param(
+            ["333"],
+            {"return_value": False},
+            ["Failed to kill 1 operation(s)"],
+            id="all_fail",
+        ),
+        pytest.param(
+            ["444"],
+            {"side_effect": Exception("Database error")},
+            ["Failed to kill operation 444", "Failed to kill 1 operation(s)"],
+            id="exception",
+        ),
+    ],
+)
+async def test_kill_selected(
     app: MongoOpsManager,
+    wait_for,
+    assert_notified,
+    opids,
+    kill_behavior,
+    expected_notifications,
 ):
-    """Test kill selected action with selected operations."""
+    """Test kill selected outcomes: success, partial failure, failure, error."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
-
-        # Create a complete operation object with all expected fields
-        test_operation = {
-            "opid": "12345",
-            "op": "query",
-            "ns": "test.collection",
-            "client": "127.0.0.1:12345",
-            "desc": "conn123",
-            "secs_running": 10,
-            "command": {"find": "collection", "filter": {"test": "value"}},
-        }
+        await wait_for(lambda: _initial_refresh_done(app))
 
-        app.operations_view.selected_ops = {"12345"}
-        app.mongodb.get_operations.return_value = [test_operation]
-        app.mongodb.kill_operation.return_value = True
+        operations = [
+            {
+                "opid": opid,
+                "op": "query",
+                "ns": "test.collection",
+                "client": f"127.0.0.1:{opid}",
+                "desc": f"conn{opid}",
+                "secs_running": 10,
+                "command": {"find": "collection", "filter": {"test": "value"}},
+            }
+            for opid in opids
+        ]
 
-        # Trigger kill action
-        await pilot.press("ctrl+k")
-        await pilot.pause(0.2)  # Give more time for dialog to appear
+        app.operations_view.selected_ops = set(opids)
+        app.mongodb.get_operations.return_value = operations
+        for attribute, value in kill_behavior.items():
+            setattr(app.mongodb.kill_operation, attribute, value)
 
-        # Click the "Yes" button directly instead of navigating
-        yes_button = app.screen.query_one("#yes")
-        await pilot.click(yes_button)
-        await pilot.pause(0.3)  # Give more time for async operations
+        # Trigger kill action and wait for the dialog to appear
+        await pilot.press("ctrl+k")
+        await wait_for(lambda: app.screen.query("#yes"))
+        await pilot.click("#yes")
 
-        app.mongodb.kill_operation.assert_called_with("12345", host=None)
-        assert "Successfully killed 1 operation(s)" in [
-            n.message for n in pilot.app._notifications
-        ]
+        await assert_notified(app, *expected_notifications)
+        if len(opids) == 1:
+            app.mongodb.kill_operation.assert_called_with(opids[0], host=None)
         assert not app.operations_view.selected_ops
 
 
-async def test_kill_selected_passes_reporting_host(app: MongoOpsManager):
+async def test_kill_selected_passes_reporting_host(app: MongoOpsManager, wait_for):
     """Test the kill is pinned to the host that reported the operation."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await wait_for(lambda: _initial_refresh_done(app))
 
         app.operations_view.selected_ops = {"12345"}
         app.operations_view.current_ops = [
@@ -144,17 +196,19 @@ async def test_kill_selected_passes_reporting_host(app: MongoOpsManager):
         app.mongodb.kill_operation.return_value = True
 
         await pilot.press("ctrl+k")
-        await pilot.pause(0.2)
+        await wait_for(lambda: app.screen.query("#yes"))
         await pilot.click("#yes")
-        await pilot.pause(0.3)
+        await wait_for(lambda: app.mongodb.kill_operation.called)
 
         app.mongodb.kill_operation.assert_called_with("12345", host="node-1:27017")
 
 
-async def test_kill_selected_skips_operations_missing_opid(app: MongoOpsManager):
+async def test_kill_selected_skips_operations_missing_opid(
+    app: MongoOpsManager, wait_for, assert_notified
+):
     """Test kill selected handles malformed operation entries gracefully."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await wait_for(lambda: _initial_refresh_done(app))
 
         app.operations_view.selected_ops = {"555"}
         app.mongodb.get_operations.return_value = [
@@ -170,13 +224,11 @@ async def test_kill_selected_skips_operations_missing_opid(app: MongoOpsManager)
         ]
 
         await pilot.press("ctrl+k")
-        await pilot.pause(0.2)
+        await wait_for(lambda: app.screen.query("#yes"))
         await pilot.click("#yes")
-        await pilot.pause(0.3)
+        await assert_notified(app, "Successfully killed 1 operation(s)")
 
         app.mongodb.kill_operation.assert_called_with("555", host=None)
-        notifications = [n.message for n in pilot.app._notifications]
-        assert any("Successfully killed 1 operation(s)" in msg for msg in notifications)
 
 
 async def test_show_help_action(app: MongoOpsManager):
@@ -233,20 +285,20 @@ async def test_sort_by_time_action(app: MongoOpsManager):
         assert app.operations_view.sort_running_time_asc
 
 
-async def test_toggle_selection_action(app: MongoOpsManager):
+async def test_toggle_selection_action(app: MongoOpsManager, wait_for):
     """Test toggling selection of all operations."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await wait_for(lambda: _initial_refresh_done(app))
         app.mongodb.get_operations.return_value = [
             {"opid": "1"},
             {"opid": "2"},
         ]
         await pilot.press("ctrl+r")
-        await pilot.pause(0.1)
+        await wait_for(lambda: app.operations_view.row_count == 2)
 
         assert not app.operations_view.selected_ops
         await pilot.press("ctrl+a")
-        await pilot.pause(0.1)  # need to wait for rows to be added.
+        await wait_for(lambda: len(app.operations_view.selected_ops) == 2)
         assert len(app.operations_view.selected_ops) == 2
 
         await pilot.press("ctrl+a")
@@ -257,16 +309,12 @@ def test_main_function(monkeypatch):
     """Test the main function of the app."""
     mock_app_run = MagicMock()
     monkeypatch.setattr("close_mongo_ops_manager.app.MongoOpsManager.run", mock_app_run)
-    monkeypatch.setattr(
-        "sys.argv",
-        ["close-mongo-ops-manager", "--host", "localhost", "--port", "27017"],
-    )
 
-    main()
+    main(argv=["--host", "localhost", "--port", "27017"])
     mock_app_run.assert_called_once()
 
 
-async def test_display_operation_with_mongos_metadata(app: MongoOpsManager):
+async def test_display_operation_with_mongos_metadata(app: MongoOpsManager, wait_for):
     """Test that operations with mongos metadata are displayed correctly."""
     # Sample operation with full clientMetadata including mongos info
     sample_operation = {
@@ -296,14 +344,14 @@ async def test_display_operation_with_mongos_metadata(app: MongoOpsManager):
     }
 
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await wait_for(lambda: _initial_refresh_done(app))
 
         # Mock get_operations to return our sample operation
         app.mongodb.get_operations.return_value = [sample_operation]
 
         # Refresh to load the operation
         await pilot.press("ctrl+r")
-        await pilot.pause(0.1)
+        await wait_for(lambda: app.operations_view.current_ops)
 
         # Verify the operation was added to the table
         assert len(app.operations_view.current_ops) == 1
@@ -335,147 +383,35 @@ async def test_display_operation_with_mongos_metadata(app: MongoOpsManager):
         assert app.operations_view.row_count == 1
 
 
-async def test_refresh_operations_mongodb_none(app: MongoOpsManager):
+async def test_refresh_operations_mongodb_none(app: MongoOpsManager, wait_for):
     """Test refresh_operations when mongodb is None."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await wait_for(lambda: _initial_refresh_done(app))
         # Set mongodb to None to simulate disconnection
         app.mongodb = None
 
         # Refresh should not raise an error, just return early
         await pilot.press("ctrl+r")
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         # View should not be loading
         assert not app.operations_view.loading
 
 
-async def test_kill_selected_partial_failure(app: MongoOpsManager):
-    """Test kill selected when some kills succeed and some fail."""
-    async with app.run_test() as pilot:
-        await pilot.pause(0.1)
-
-        # Create operations
-        operations = [
-            {
-                "opid": "111",
-                "op": "query",
-                "ns": "test.collection",
-                "client": "127.0.0.1:11111",
-                "desc": "conn111",
-                "secs_running": 5,
-                "command": {"find": "collection"},
-            },
-            {
-                "opid": "222",
-                "op": "query",
-                "ns": "test.collection",
-                "client": "127.0.0.1:22222",
-                "desc": "conn222",
-                "secs_running": 10,
-                "command": {"find": "collection"},
-            },
-        ]
-
-        app.operations_view.selected_ops = {"111", "222"}
-        app.mongodb.get_operations.return_value = operations
-
-        # First kill succeeds, second fails
-        app.mongodb.kill_operation.side_effect = [True, False]
-
-        await pilot.press("ctrl+k")
-        await pilot.pause(0.2)
-        await pilot.click("#yes")
-        await pilot.pause(0.3)
-
-        # Should have notified about success and failure
-        notifications = [n.message for n in pilot.app._notifications]
-        assert any("Successfully killed 1 operation(s)" in msg for msg in notifications)
-        assert any("Failed to kill 1 operation(s)" in msg for msg in notifications)
-
-
-async def test_kill_selected_all_fail(app: MongoOpsManager):
-    """Test kill selected when all kill operations fail."""
-    async with app.run_test() as pilot:
-        await pilot.pause(0.1)
-
-        # Create operation
-        operation = {
-            "opid": "333",
-            "op": "query",
-            "ns": "test.collection",
-            "client": "127.0.0.1:33333",
-            "desc": "conn333",
-            "secs_running": 5,
-            "command": {"find": "collection"},
-        }
-
-        app.operations_view.selected_ops = {"333"}
-        app.mongodb.get_operations.return_value = [operation]
-
-        # Kill fails
-        app.mongodb.kill_operation.return_value = False
-
-        await pilot.press("ctrl+k")
-        await pilot.pause(0.2)
-        await pilot.click("#yes")
-        await pilot.pause(0.3)
-
-        # Should have notified about failure
-        notifications = [n.message for n in pilot.app._notifications]
-        assert any("Failed to kill 1 operation(s)" in msg for msg in notifications)
-
-
-async def test_kill_selected_with_exception(app: MongoOpsManager):
-    """Test kill selected when kill_operation raises an exception."""
-    async with app.run_test() as pilot:
-        await pilot.pause(0.1)
-
-        # Create operation
-        operation = {
-            "opid": "444",
-            "op": "query",
-            "ns": "test.collection",
-            "client": "127.0.0.1:44444",
-            "desc": "conn444",
-            "secs_running": 5,
-            "command": {"find": "collection"},
-        }
-
-        app.operations_view.selected_ops = {"444"}
-        app.mongodb.get_operations.return_value = [operation]
-
-        # Kill raises exception
-        app.mongodb.kill_operation.side_effect = Exception("Database error")
-
-        await pilot.press("ctrl+k")
-        await pilot.pause(0.2)
-        await pilot.click("#yes")
-        await pilot.pause(0.3)
-
-        # Should have handled the exception and shown error notification
-        notifications = [n.message for n in pilot.app._notifications]
-        error_notification = any(
-            "Failed to kill operation 444" in msg or "Database error" in msg
-            for msg in notifications
-        )
-        assert error_notification
-
-
-async def test_refresh_operations_get_operations_fails(app: MongoOpsManager):
+async def test_refresh_operations_get_operations_fails(
+    app: MongoOpsManager, wait_for, assert_notified
+):
     """Test refresh when get_operations raises an exception."""
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await wait_for(lambda: _initial_refresh_done(app))
 
         # Make get_operations raise an exception
         app.mongodb.get_operations.side_effect = Exception("Query failed")
 
         await pilot.press("ctrl+r")
-        await pilot.pause(0.2)
 
         # Should show error notification
-        notifications = [n.message for n in pilot.app._notifications]
-        assert any("Failed to refresh" in msg for msg in notifications)
+        await assert_notified(app, "Failed to refresh")
 
 
 def test_validate_refresh_interval_clamps_low():
@@ -502,10 +438,9 @@ def test_main_builds_auth_connection_string(monkeypatch):
     mock_app_instance = MagicMock()
     mock_app_class = MagicMock(return_value=mock_app_instance)
     monkeypatch.setattr("close_mongo_ops_manager.app.MongoOpsManager", mock_app_class)
-    monkeypatch.setattr(
-        "sys.argv",
-        [
-            "close-mongo-ops-manager",
+
+    main(
+        argv=[
             "--host",
             "db.example.com",
             "--port",
@@ -516,10 +451,8 @@ def test_main_builds_auth_connection_string(monkeypatch):
             "secret",
             "--auth-source",
             "authdb",
-        ],
+        ]
     )
-
-    main()
     call_kwargs = mock_app_class.call_args[1]
     assert "admin" in call_kwargs["connection_string"]
     assert "secret" in call_kwargs["connection_string"]
@@ -535,12 +468,8 @@ def test_main_builds_no_auth_connection_string(monkeypatch):
     # Clear any env vars that might provide credentials
     monkeypatch.delenv("MONGODB_USERNAME", raising=False)
     monkeypatch.delenv("MONGODB_PASSWORD", raising=False)
-    monkeypatch.setattr(
-        "sys.argv",
-        ["close-mongo-ops-manager", "--host", "localhost", "--port", "27017"],
-    )
 
-    main()
+    main(argv=["--host", "localhost", "--port", "27017"])
     call_kwargs = mock_app_class.call_args[1]
     assert call_kwargs["connection_string"] == "mongodb://localhost:27017/"
 
@@ -554,11 +483,7 @@ def test_main_clamps_refresh_interval(monkeypatch):
     monkeypatch.setattr("close_mongo_ops_manager.app.MongoOpsManager", mock_app_class)
     monkeypatch.delenv("MONGODB_USERNAME", raising=False)
     monkeypatch.delenv("MONGODB_PASSWORD", raising=False)
-    monkeypatch.setattr(
-        "sys.argv",
-        ["close-mongo-ops-manager", "--refresh-interval", "999"],
-    )
 
-    main()
+    main(argv=["--refresh-interval", "999"])
     call_kwargs = mock_app_class.call_args[1]
     assert call_kwargs["refresh_interval"] == 10
@@ -36,9 +36,9 @@ async def test_filterbar_input_posts_filter_changed():
     async with app.run_test() as pilot:
         opid_input = app.query_one("#filter-opid", Input)
         opid_input.focus()
-        await pilot.pause(0.1)
+        await pilot.pause()
         opid_input.value = "12345"
-        await pilot.pause(0.1)
+        await pilot.pause()
         # Should have received at least one FilterChanged with opid
         matching = [f for f in app.filter_messages if f.get("opid") == "12345"]
         assert len(matching) > 0
@@ -50,12 +50,12 @@ async def test_filterbar_empty_inputs_excluded():
     async with app.run_test() as pilot:
         opid_input = app.query_one("#filter-opid", Input)
         opid_input.focus()
-        await pilot.pause(0.1)
+        await pilot.pause()
         # Type something then clear it
         opid_input.value = "x"
-        await pilot.pause(0.1)
+        await pilot.pause()
         opid_input.value = ""
-        await pilot.pause(0.1)
+        await pilot.pause()
         # Last message should have no filters
         assert app.filter_messages[-1] == {}
 
@@ -66,7 +66,7 @@ async def test_filterbar_multiple_filters_combine():
     async with app.run_test() as pilot:
         app.query_one("#filter-opid", Input).value = "123"
         app.query_one("#filter-operation", Input).value = "query"
-        await pilot.pause(0.1)
+        await pilot.pause()
         # Find a message containing both filters
         matching = [
             f
@@ -83,11 +83,11 @@ async def test_filterbar_clear_button_resets_all():
         # Set some filter values
         app.query_one("#filter-opid", Input).value = "123"
         app.query_one("#filter-client", Input).value = "10.0"
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         # Click clear button
         await pilot.click("#clear-filters")
-        await pilot.pause(0.1)
+        await pilot.pause()
 
         # All inputs should be empty
         for inp in app.query_one(FilterBar).query(".filter-input"):
@@ -104,7 +104,7 @@ async def test_filterbar_id_to_key_conversion():
     async with app.run_test() as pilot:
         # The running-time input should produce key "running_time"
         app.query_one("#filter-running-time", Input).value = "10"
-        await pilot.pause(0.1)
+        await pilot.pause()
         matching = [f for f in app.filter_messages if "running_time" in f]
         assert len(matching) > 0
         assert matching[-1]["running_time"] == "10"
@@ -115,6 +115,6 @@ async def test_filterbar_effective_users_key():
     app = FilterBarTestApp()
     async with app.run_test() as pilot:
         app.query_one("#filter-effective-users", Input).value = "admin"
-        await pilot.pause(0.1)
+        await pilot.pause()
         matching = [f for f in app.filter_messages if "effective_users" in f]
         assert len(matching) > 0
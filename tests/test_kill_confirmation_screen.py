@@ -27,7 +27,7 @@ async def test_kill_confirmation_renders_with_single_op():
     """Test dialog renders correct text for a single operation."""
     app = KillConfirmTestApp(["12345"])
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         question = app.screen.query_one("#question")
         assert "1 operation?" in str(question.render())
 
@@ -36,7 +36,7 @@ async def test_kill_confirmation_renders_with_multiple_ops():
     """Test dialog renders correct plural text for multiple operations."""
     app = KillConfirmTestApp(["111", "222", "333"])
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         question = app.screen.query_one("#question")
         assert "3 operations?" in str(question.render())
 
@@ -45,9 +45,9 @@ async def test_kill_confirmation_yes_button_dismisses_true():
     """Test clicking Yes button dismisses with True."""
     app = KillConfirmTestApp(["12345"])
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         await pilot.click("#yes")
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert app.result is True
 
 
@@ -55,9 +55,9 @@ async def test_kill_confirmation_no_button_dismisses_false():
     """Test clicking No button dismisses with False."""
     app = KillConfirmTestApp(["12345"])
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         await pilot.click("#no")
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert app.result is False
 
 
@@ -65,7 +65,7 @@ async def test_kill_confirmation_escape_dismisses_false():
     """Test pressing Escape dismisses with False."""
     app = KillConfirmTestApp(["12345"])
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         await pilot.press("escape")
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert app.result is False
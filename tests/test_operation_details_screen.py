@@ -24,7 +24,7 @@ async def test_details_displays_basic_fields(sample_mongodb_operation):
     """Test that basic operation fields are displayed."""
     app = DetailsTestApp(sample_mongodb_operation)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         text_area = app.screen.query_one(TextArea)
         content = text_area.text
         assert "123456" in content
@@ -37,7 +37,7 @@ async def test_details_displays_client_info(sample_mongodb_operation):
     """Test that client info is displayed."""
     app = DetailsTestApp(sample_mongodb_operation)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         text_area = app.screen.query_one(TextArea)
         content = text_area.text
         assert "192.168.1.100:54321" in content
@@ -47,7 +47,7 @@ async def test_details_displays_mongos_metadata(sample_mongodb_operation_with_mo
     """Test that mongos metadata is extracted and displayed."""
     app = DetailsTestApp(sample_mongodb_operation_with_mongos)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         text_area = app.screen.query_one(TextArea)
         content = text_area.text
         # Should contain the short hostname from mongos
@@ -58,7 +58,7 @@ async def test_details_displays_command_details(sample_mongodb_operation):
     """Test that command details are formatted as key-value pairs."""
     app = DetailsTestApp(sample_mongodb_operation)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         text_area = app.screen.query_one(TextArea)
         content = text_area.text
         assert "Command Details:" in content
@@ -78,7 +78,7 @@ async def test_details_displays_plan_summary():
     }
     app = DetailsTestApp(op)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         text_area = app.screen.query_one(TextArea)
         content = text_area.text
         assert "Plan Summary: IXSCAN { _id: 1 }" in content
@@ -89,7 +89,7 @@ async def test_details_missing_fields_show_fallback():
     op = {"opid": 1}  # Minimal operation
     app = DetailsTestApp(op)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         text_area = app.screen.query_one(TextArea)
         content = text_area.text
         assert "Type: N/A" in content
@@ -101,8 +101,8 @@ async def test_details_escape_dismisses():
     op = {"opid": 1, "op": "query", "ns": "test.col"}
     app = DetailsTestApp(op)
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert len(app.screen_stack) > 1
         await pilot.press("escape")
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert len(app.screen_stack) == 1
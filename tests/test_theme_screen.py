@@ -32,7 +32,7 @@ async def test_theme_screen_renders_all_themes():
     themes = ["textual-dark", "nord", "dracula"]
     app = ThemeTestApp(themes, "textual-dark")
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         option_list = app.screen.query_one("#theme-list", OptionList)
         assert option_list.option_count == 3
 
@@ -42,7 +42,7 @@ async def test_theme_screen_highlights_current_theme():
     themes = ["textual-dark", "nord", "dracula"]
     app = ThemeTestApp(themes, "nord")
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         option_list = app.screen.query_one("#theme-list", OptionList)
         assert option_list.highlighted == 1  # nord is index 1
 
@@ -52,10 +52,10 @@ async def test_theme_screen_select_dismisses_with_theme():
     themes = ["textual-dark", "nord", "dracula"]
     app = ThemeTestApp(themes, "textual-dark")
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         # Press enter to select the currently highlighted theme
         await pilot.press("enter")
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert app.result == "textual-dark"
 
 
@@ -64,7 +64,7 @@ async def test_theme_screen_escape_dismisses_without_selection():
     themes = ["textual-dark", "nord"]
     app = ThemeTestApp(themes, "textual-dark")
     async with app.run_test() as pilot:
-        await pilot.pause(0.1)
+        await pilot.pause()
         await pilot.press("escape")
-        await pilot.pause(0.1)
+        await pilot.pause()
         assert app.result is None